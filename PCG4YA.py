@@ -6,7 +6,10 @@ Controls: Arrow Keys=Move, Z=Jump, X=Dash (Classic Celeste controls)
 import pygame
 import random
 import math
+from bisect import bisect_left, bisect_right
+from collections import deque
 from enum import Enum
+from itertools import islice
 
 # Initialize Pygame
 pygame.init()
@@ -34,6 +37,40 @@ DASH_SPEED = 20
 DASH_DURATION = 10
 COYOTE_TIME = 6
 
+# Dash velocity per (x, y) input direction, diagonals normalized
+DASH_DIAGONAL = DASH_SPEED / 2 ** 0.5
+DASH_VELOCITIES = {
+    (0, 0): (DASH_SPEED, 0),  # Default to right if no direction pressed
+    (1, 0): (DASH_SPEED, 0),
+    (-1, 0): (-DASH_SPEED, 0),
+    (0, 1): (0, DASH_SPEED),
+    (0, -1): (0, -DASH_SPEED),
+    (1, 1): (DASH_DIAGONAL, DASH_DIAGONAL),
+    (1, -1): (DASH_DIAGONAL, -DASH_DIAGONAL),
+    (-1, 1): (-DASH_DIAGONAL, DASH_DIAGONAL),
+    (-1, -1): (-DASH_DIAGONAL, -DASH_DIAGONAL),
+}
+
+# Key Bindings
+KEY_LEFT = pygame.K_LEFT
+KEY_RIGHT = pygame.K_RIGHT
+KEY_UP = pygame.K_UP
+KEY_DOWN = pygame.K_DOWN
+KEY_JUMP = pygame.K_z
+KEY_DASH = pygame.K_x
+
+# Broad Phase
+HASH_CELL_SIZE = 200
+
+
+def enclosing_rect(left, top, right, bottom):
+    """Get smallest integer rect enclosing float bounds"""
+    # Platform bounds are integers, so testing against the enclosing
+    # rect gives the same result as testing the float bounds
+    x = math.floor(left)
+    y = math.floor(top)
+    return pygame.Rect(x, y, math.ceil(right) - x, math.ceil(bottom) - y)
+
 
 class PlatformType(Enum):
     NORMAL = 1
@@ -42,6 +79,15 @@ class PlatformType(Enum):
     MOVING = 4
 
 
+# Platform body colors (crumbling platforms also flash RED while crumbling)
+PLATFORM_COLORS = {
+    PlatformType.NORMAL: GREEN,
+    PlatformType.CRUMBLING: GRAY,
+    PlatformType.BOUNCY: PURPLE,
+    PlatformType.MOVING: YELLOW,
+}
+
+
 class Player:
     """Player character with physics and controls"""
     
@@ -58,13 +104,35 @@ class Player:
         self.dashing = False
         self.coyote_timer = 0
         
-    def update(self, keys, platforms):
+        # Pre-rendered sprites keyed by dashing state
+        self.sprites = {False: self.render_sprite(BLUE), True: self.render_sprite(YELLOW)}
+        
+    def render_sprite(self, color):
+        """Render player body and eyes to a surface once"""
+        sprite = pygame.Surface((self.width, self.height))
+        sprite.fill(color)
+        # Draw eyes
+        pygame.draw.circle(sprite, WHITE, (10, 12), 4)
+        pygame.draw.circle(sprite, WHITE, (20, 12), 4)
+        pygame.draw.circle(sprite, BLACK, (10, 12), 2)
+        pygame.draw.circle(sprite, BLACK, (20, 12), 2)
+        return sprite.convert()
+    
+    def update(self, keys, spatial_hash):
         """Update player position and handle input"""
+        # Read each key once
+        left = keys[KEY_LEFT]
+        right = keys[KEY_RIGHT]
+        up = keys[KEY_UP]
+        down = keys[KEY_DOWN]
+        jump = keys[KEY_JUMP]
+        dash = keys[KEY_DASH]
+        
         # Horizontal movement
         if not self.dashing:
-            if keys[pygame.K_LEFT]:
+            if left:
                 self.vel_x = -PLAYER_SPEED
-            elif keys[pygame.K_RIGHT]:
+            elif right:
                 self.vel_x = PLAYER_SPEED
             else:
                 self.vel_x = 0
@@ -76,13 +144,13 @@ class Player:
             self.coyote_timer -= 1
 
         # Jumping (Z key - Celeste classic)
-        if keys[pygame.K_z] and self.coyote_timer > 0 and self.vel_y >= 0:
+        if jump and self.coyote_timer > 0 and self.vel_y >= 0:
             self.vel_y = JUMP_STRENGTH
             self.coyote_timer = 0
             self.on_ground = False
         
         # Dash mechanic (X key - Celeste classic)
-        if keys[pygame.K_x] and self.dash_cooldown <= 0 and not self.dashing:
+        if dash and self.dash_cooldown <= 0 and not self.dashing:
             self.dashing = True
             self.dash_timer = DASH_DURATION
             self.dash_cooldown = 60
@@ -91,25 +159,17 @@ class Player:
             dash_x = 0
             dash_y = 0
             
-            if keys[pygame.K_LEFT]:
+            if left:
                 dash_x = -1
-            elif keys[pygame.K_RIGHT]:
+            elif right:
                 dash_x = 1
             
-            if keys[pygame.K_UP]:
+            if up:
                 dash_y = -1
-            elif keys[pygame.K_DOWN]:
+            elif down:
                 dash_y = 1
             
-            # Default to right if no direction pressed
-            if dash_x == 0 and dash_y == 0:
-                dash_x = 1
-            
-            # Normalize diagonal dashes
-            magnitude = math.sqrt(dash_x**2 + dash_y**2)
-            if magnitude > 0:
-                self.vel_x = (dash_x / magnitude) * DASH_SPEED
-                self.vel_y = (dash_y / magnitude) * DASH_SPEED
+            self.vel_x, self.vel_y = DASH_VELOCITIES[(dash_x, dash_y)]
         
         # Handle dash
         if self.dashing:
@@ -126,64 +186,80 @@ class Player:
             self.vel_y += GRAVITY
         
         # Apply velocity
+        start_y = self.y
         self.x += self.vel_x
         self.y += self.vel_y
         
-        # Collision detection
+        # Collision detection (platforms are one-way, so only falling can land)
         self.on_ground = False
-        for platform in platforms:
-            if self.check_collision(platform):
-                self.handle_collision(platform)
+        if self.vel_y <= 0:
+            return
+        
+        # Broad phase over the vertical span the player swept through this frame
+        sweep = enclosing_rect(self.x, start_y, self.x + self.width, self.y + self.height)
+        candidates = list(spatial_hash.query(sweep.left, sweep.right, sweep.top, sweep.bottom))
+        
+        # Narrow phase: of the platforms crossed from above, the highest was reached first
+        landing = None
+        for index in sweep.collidelistall(candidates):
+            platform = candidates[index]
+            if self.can_land_on(start_y, platform) and (landing is None or platform.y < landing.y):
+                landing = platform
+        if landing is not None:
+            self.handle_collision(landing)
+    
+    def get_rect(self):
+        """Get smallest integer rect enclosing the player"""
+        return enclosing_rect(self.x, self.y, self.x + self.width, self.y + self.height)
     
-    def check_collision(self, platform):
-        """Check if player collides with platform"""
-        return (self.x < platform.x + platform.width and
-                self.x + self.width > platform.x and
-                self.y < platform.y + platform.height and
-                self.y + self.height > platform.y)
+    def can_land_on(self, start_y, platform):
+        """Check if this frame's move crossed the top of platform"""
+        # Must end the move over the platform
+        if not (self.x < platform.x + platform.width and self.x + self.width > platform.x):
+            return False
+        
+        # Bottom edge must start at most 5px below the top and end below it,
+        # however far past the top the move carried it
+        bottom = start_y + self.height
+        return bottom <= platform.y + 5 and bottom + self.vel_y > platform.y
     
     def handle_collision(self, platform):
-        """Handle collision with platform"""
-        # Only collide from top
-        if self.vel_y > 0 and self.y + self.height - self.vel_y <= platform.y + 5:
-            self.y = platform.y - self.height
-            self.vel_y = 0
-            self.on_ground = True
-            
-            # Handle platform-specific effects
-            if platform.platform_type == PlatformType.BOUNCY:
-                self.vel_y = JUMP_STRENGTH * 1.5
-                self.on_ground = False
-            elif platform.platform_type == PlatformType.CRUMBLING:
-                platform.start_crumble()
+        """Land on top of platform"""
+        self.y = platform.y - self.height
+        self.vel_y = 0
+        self.on_ground = True
+        
+        # Handle platform-specific effects
+        if platform.platform_type == PlatformType.BOUNCY:
+            self.vel_y = JUMP_STRENGTH * 1.5
+            self.on_ground = False
+        elif platform.platform_type == PlatformType.CRUMBLING:
+            platform.start_crumble()
     
     def draw(self, screen, camera_x, camera_y):
         """Draw player on screen"""
-        color = YELLOW if self.dashing else BLUE
-        pygame.draw.rect(screen, color, 
-                        (self.x - camera_x, self.y - camera_y, self.width, self.height))
-        # Draw eyes
-        pygame.draw.circle(screen, WHITE, 
-                          (int(self.x - camera_x + 10), int(self.y - camera_y + 12)), 4)
-        pygame.draw.circle(screen, WHITE, 
-                          (int(self.x - camera_x + 20), int(self.y - camera_y + 12)), 4)
-        pygame.draw.circle(screen, BLACK, 
-                          (int(self.x - camera_x + 10), int(self.y - camera_y + 12)), 2)
-        pygame.draw.circle(screen, BLACK, 
-                          (int(self.x - camera_x + 20), int(self.y - camera_y + 12)), 2)
+        screen.blit(self.sprites[self.dashing], (self.x - camera_x, self.y - camera_y))
 
 
 class Platform:
     """Platform class with different types and behaviors"""
     
-    def __init__(self, x, y, width, platform_type=PlatformType.NORMAL):
+    # Fixed attribute layout: compact instances and no per-instance dict lookups
+    __slots__ = ("x", "y", "width", "height", "rect", "platform_type", "crumble_timer",
+                 "color", "on_deactivate", "original_y", "move_range",
+                 "move_speed", "move_direction")
+    
+    def __init__(self, x, y, width, platform_type=PlatformType.NORMAL, on_deactivate=None):
         self.x = x
         self.y = y
         self.width = width
         self.height = 20
+        # Integer bounds for C-level collision tests, kept in sync with x/y
+        self.rect = pygame.Rect(x, y, width, self.height)
         self.platform_type = platform_type
         self.crumble_timer = 0
-        self.active = True
+        self.color = PLATFORM_COLORS[platform_type]
+        self.on_deactivate = on_deactivate
         
         # Moving platform properties
         if platform_type == PlatformType.MOVING:
@@ -197,61 +273,114 @@ class Platform:
         if self.platform_type == PlatformType.CRUMBLING and self.crumble_timer > 0:
             self.crumble_timer -= 1
             if self.crumble_timer <= 0:
-                self.active = False
+                if self.on_deactivate:
+                    self.on_deactivate(self)
+            else:
+                self.update_crumble_color()
         
         if self.platform_type == PlatformType.MOVING:
             self.y += self.move_speed * self.move_direction
+            self.rect.y = self.y
             if abs(self.y - self.original_y) > self.move_range:
                 self.move_direction *= -1
     
+    def get_vertical_extent(self):
+        """Get the (top, bottom) range the platform can ever occupy"""
+        if self.platform_type == PlatformType.MOVING:
+            # Travel reverses one step past move_range from the original position
+            reach = self.move_range + self.move_speed
+            return self.original_y - reach, self.original_y + self.height + reach
+        return self.y, self.y + self.height
+    
     def start_crumble(self):
         """Start crumbling animation"""
         if self.crumble_timer == 0:
             self.crumble_timer = 30
+            self.update_crumble_color()
     
-    def draw(self, screen, camera_x, camera_y):
-        """Draw platform on screen"""
-        if not self.active:
-            return
-        
-        # Choose color based on type
-        if self.platform_type == PlatformType.NORMAL:
-            color = GREEN
-        elif self.platform_type == PlatformType.CRUMBLING:
-            if self.crumble_timer > 0 and self.crumble_timer % 10 < 5:
-                color = RED
-            else:
-                color = GRAY
-        elif self.platform_type == PlatformType.BOUNCY:
-            color = PURPLE
-        elif self.platform_type == PlatformType.MOVING:
-            color = YELLOW
-        
-        pygame.draw.rect(screen, color, 
-                        (self.x - camera_x, self.y - camera_y, self.width, self.height))
-        
-        # Add visual indicators
+    def update_crumble_color(self):
+        """Flash between red and gray as the crumble timer counts down"""
+        self.color = RED if self.crumble_timer % 10 < 5 else GRAY
+    
+    def draw_markings(self, screen, camera_x, camera_y):
+        """Draw type indicators on top of the platform body"""
+        screen_x = self.x - camera_x
+        screen_y = self.y - camera_y
         if self.platform_type == PlatformType.BOUNCY:
             for i in range(0, int(self.width), 20):
                 pygame.draw.line(screen, WHITE, 
-                               (self.x - camera_x + i, self.y - camera_y + 5),
-                               (self.x - camera_x + i, self.y - camera_y + 15), 2)
+                               (screen_x + i, screen_y + 5),
+                               (screen_x + i, screen_y + 15), 2)
         elif self.platform_type == PlatformType.MOVING:
+            center_x = screen_x + self.width // 2
             pygame.draw.polygon(screen, BLACK, [
-                (self.x - camera_x + self.width // 2, self.y - camera_y + 5),
-                (self.x - camera_x + self.width // 2 - 5, self.y - camera_y + 12),
-                (self.x - camera_x + self.width // 2 + 5, self.y - camera_y + 12)
+                (center_x, screen_y + 5),
+                (center_x - 5, screen_y + 12),
+                (center_x + 5, screen_y + 12)
             ])
 
 
+class SpatialHash:
+    """Uniform grid that buckets platforms by x for cheap collision lookups"""
+    
+    def __init__(self, cell_size=HASH_CELL_SIZE):
+        self.cell_size = cell_size
+        self.buckets = {}
+    
+    def cells(self, x_min, x_max):
+        """Range of cell keys covering the span [x_min, x_max]"""
+        return range(int(x_min // self.cell_size), int(x_max // self.cell_size) + 1)
+    
+    def insert(self, platform):
+        """Add platform to every cell it overlaps"""
+        # Store the full vertical extent so moving platforms never need
+        # re-inserting and queries can skip platforms far above or below
+        top, bottom = platform.get_vertical_extent()
+        entry = (top, bottom, platform)
+        for cell in self.cells(platform.x, platform.x + platform.width):
+            self.buckets.setdefault(cell, []).append(entry)
+    
+    def remove(self, platform):
+        """Remove platform from every cell it overlaps"""
+        for cell in self.cells(platform.x, platform.x + platform.width):
+            bucket = self.buckets.get(cell)
+            if bucket is None:
+                continue
+            for index, entry in enumerate(bucket):
+                if entry[2] is platform:
+                    del bucket[index]
+                    break
+            if not bucket:
+                del self.buckets[cell]
+    
+    def query(self, x_min, x_max, y_min, y_max):
+        """Yield each platform near [x_min, x_max] that can reach [y_min, y_max], once"""
+        cells = self.cells(x_min, x_max)
+        first = cells.start
+        for cell in cells:
+            for top, bottom, platform in self.buckets.get(cell, ()):
+                if top >= y_max or bottom <= y_min:
+                    continue
+                # Platforms spanning several cells are reported from the first one visited
+                if cell == first or int(platform.x // self.cell_size) == cell:
+                    yield platform
+
+
 class PlatformGenerator:
     """Simple, reliable linear procedural platform generation"""
     
     def __init__(self, seed=None):
         self.seed = seed if seed else random.randint(0, 1000000)
-        random.seed(self.seed)
-        
-        self.platforms = []
+        # Private generator so seeding never disturbs the global random state
+        self.rng = random.Random(self.seed)
+        
+        # Platforms are generated left to right, so both deques stay sorted by x
+        self.platforms = deque()
+        self.platform_xs = deque()
+        self.max_platform_width = 0
+        self.spatial_hash = SpatialHash()
+        # Crumbled platforms are removed once the update loop finishes
+        self.deactivated = []
         self.last_platform_x = 0
         self.last_platform_y = 400
         self.difficulty = 0
@@ -264,7 +393,7 @@ class PlatformGenerator:
     def generate_starting_platform(self):
         """Generate safe starting platform"""
         start = Platform(0, 400, 250, PlatformType.NORMAL)
-        self.platforms.append(start)
+        self.add_platform(start)
         self.last_platform_x = 0
         self.last_platform_y = 400
     
@@ -273,12 +402,12 @@ class PlatformGenerator:
         # Horizontal spacing
         base_spacing = 150
         spacing_variance = 50 + int(self.difficulty * 30)
-        spacing = base_spacing + random.randint(-50, spacing_variance)
+        spacing = base_spacing + self.rng.randint(-50, spacing_variance)
         spacing = max(80, spacing)
         
         # Vertical offset
         vertical_variance = 80 + int(self.difficulty * 40)
-        vertical_offset = random.randint(-vertical_variance, vertical_variance)
+        vertical_offset = self.rng.randint(-vertical_variance, vertical_variance)
         
         # Calculate new position
         new_x = self.last_platform_x + spacing
@@ -290,15 +419,15 @@ class PlatformGenerator:
         # Platform width (decreases with difficulty)
         base_width = 150
         width_reduction = int(self.difficulty * 20)
-        width = base_width - width_reduction + random.randint(-30, 30)
+        width = base_width - width_reduction + self.rng.randint(-30, 30)
         width = max(60, width)
         
         # Choose platform type
         platform_type = self.choose_platform_type()
         
         # Create platform
-        platform = Platform(new_x, new_y, width, platform_type)
-        self.platforms.append(platform)
+        platform = Platform(new_x, new_y, width, platform_type, self.on_deactivate)
+        self.add_platform(platform)
         
         # Update last position
         self.last_platform_x = new_x
@@ -307,12 +436,19 @@ class PlatformGenerator:
         # Update difficulty
         self.difficulty = min(new_x / 1000, 5)
     
+    def add_platform(self, platform):
+        """Append platform to the x-sorted storage and spatial hash"""
+        self.platforms.append(platform)
+        self.platform_xs.append(platform.x)
+        self.max_platform_width = max(self.max_platform_width, platform.width)
+        self.spatial_hash.insert(platform)
+    
     def choose_platform_type(self):
         """Choose platform type based on difficulty"""
         if self.difficulty < 0.5:
             return PlatformType.NORMAL
         
-        rand_val = random.random()
+        rand_val = self.rng.random()
         
         if rand_val < 0.5:
             return PlatformType.NORMAL
@@ -327,11 +463,11 @@ class PlatformGenerator:
         """Update platforms and generate new ones as needed"""
         camera_x = player.x - SCREEN_WIDTH // 3
         
-        # Remove platforms far behind camera
-        self.platforms = [
-            p for p in self.platforms 
-            if p.x > camera_x - 500
-        ]
+        # Remove platforms far behind camera (only ever the oldest ones)
+        platforms = self.platforms
+        while platforms and platforms[0].x + platforms[0].width < camera_x - 500:
+            self.spatial_hash.remove(platforms.popleft())
+            self.platform_xs.popleft()
         
         # Generate new platforms ahead of camera
         while self.last_platform_x < camera_x + SCREEN_WIDTH + 500:
@@ -340,10 +476,34 @@ class PlatformGenerator:
         # Update all platforms
         for platform in self.platforms:
             platform.update()
+        
+        # Drop platforms that crumbled away this frame
+        while self.deactivated:
+            self.remove_platform(self.deactivated.pop())
     
-    def get_active_platforms(self):
-        """Get list of active platforms"""
-        return [p for p in self.platforms if p.active]
+    def remove_platform(self, platform):
+        """Remove platform from the x-sorted storage and spatial hash"""
+        index = self.platforms.index(platform)
+        del self.platforms[index]
+        del self.platform_xs[index]
+        self.spatial_hash.remove(platform)
+    
+    def on_deactivate(self, platform):
+        """Queue a crumbled platform for removal after the update loop"""
+        self.deactivated.append(platform)
+    
+    def get_visible_platforms(self, camera_x, camera_y):
+        """Get platforms overlapping the screen"""
+        # Platforms starting left of the screen may still reach into it
+        start = bisect_left(self.platform_xs, camera_x - self.max_platform_width)
+        end = bisect_right(self.platform_xs, camera_x + SCREEN_WIDTH)
+        for platform in islice(self.platforms, start, end):
+            if platform.x + platform.width < camera_x:
+                continue
+            # Skip platforms above or below the viewport
+            if platform.y - camera_y > SCREEN_HEIGHT or platform.y - camera_y + platform.height < 0:
+                continue
+            yield platform
 
 
 class Camera:
@@ -387,6 +547,41 @@ class Game:
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
         
+        # Background grid rendered once, one cell larger than the screen for scrolling
+        self.grid_surface = pygame.Surface((SCREEN_WIDTH + 100, SCREEN_HEIGHT + 100)).convert()
+        self.grid_surface.fill(BLACK)
+        grid_color = (20, 20, 40)
+        for x in range(0, SCREEN_WIDTH + 100, 100):
+            pygame.draw.line(self.grid_surface, grid_color, (x, 0), (x, SCREEN_HEIGHT + 100), 1)
+        for y in range(0, SCREEN_HEIGHT + 100, 100):
+            pygame.draw.line(self.grid_surface, grid_color, (0, y), (SCREEN_WIDTH + 100, y), 1)
+        
+        # Solid platform bodies keyed by (color, width, height)
+        self.platform_surfaces = {}
+        
+        # Static UI text, plus score texts re-rendered only when the score changes
+        self.dash_ready_text = self.small_font.render("DASH READY", True, GREEN)
+        self.controls_text = self.small_font.render("Arrow Keys=Move  Z=Jump  X=Dash", True, GRAY)
+        self.score_text = None
+        self.score_text_value = None
+        self.final_score_text = None
+        self.final_score_text_value = None
+        
+        # Screen area covered by the dash cooldown bar or its ready text
+        self.dash_indicator_rect = self.dash_ready_text.get_rect(topleft=(10, 50)).union(
+            pygame.Rect(10, 50, 100, 10))
+        
+        # Last presented view and dynamic regions, for partial display updates
+        self.last_view = None
+        self.last_dirty_rects = []
+        
+        # Game over overlay and static messages
+        self.game_over_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.game_over_overlay.set_alpha(200)
+        self.game_over_overlay.fill(BLACK)
+        self.game_over_text = self.font.render("GAME OVER", True, RED)
+        self.restart_text = self.small_font.render("Press R to Restart", True, WHITE)
+        
         self.reset_game()
     
     def reset_game(self):
@@ -420,7 +615,7 @@ class Game:
         self.generator.update(self.player)
         
         # Update player
-        self.player.update(keys, self.generator.get_active_platforms())
+        self.player.update(keys, self.generator.spatial_hash)
         
         # Update camera
         self.camera.update(self.player)
@@ -434,29 +629,30 @@ class Game:
     
     def draw(self):
         """Draw everything on screen"""
-        # Clear screen
-        self.screen.fill(BLACK)
-        
-        # Draw background grid
         camera_x = self.camera.get_x()
         camera_y = self.camera.get_y()
         
-        grid_color = (20, 20, 40)
-        for x in range(-int(camera_x % 100), SCREEN_WIDTH, 100):
-            pygame.draw.line(self.screen, grid_color, (x, 0), (x, SCREEN_HEIGHT), 1)
-        for y in range(-int(camera_y % 100), SCREEN_HEIGHT, 100):
-            pygame.draw.line(self.screen, grid_color, (0, y), (SCREEN_WIDTH, y), 1)
-        
-        # Draw platforms
-        for platform in self.generator.get_active_platforms():
-            platform.draw(self.screen, camera_x, camera_y)
+        # Draw background grid (covers the whole screen, so no clear is needed)
+        self.screen.blit(self.grid_surface, (-(camera_x % 100), -(camera_y % 100)))
+        
+        # Draw platforms, batching all bodies into a single blit call
+        visible = list(self.generator.get_visible_platforms(camera_x, camera_y))
+        self.screen.blits([
+            (self.get_platform_surface(p.color, p.width, p.height),
+             (p.x - camera_x, p.y - camera_y))
+            for p in visible
+        ], doreturn=False)
+        for platform in visible:
+            platform.draw_markings(self.screen, camera_x, camera_y)
 
         # Draw player
         self.player.draw(self.screen, camera_x, camera_y)
         
         # Draw UI
-        score_text = self.font.render(f"Score: {self.score}", True, WHITE)
-        self.screen.blit(score_text, (10, 10))
+        if self.score != self.score_text_value:
+            self.score_text = self.font.render(f"Score: {self.score}", True, WHITE)
+            self.score_text_value = self.score
+        self.screen.blit(self.score_text, (10, 10))
         
         # Dash cooldown indicator
         if self.player.dash_cooldown > 0:
@@ -464,35 +660,63 @@ class Game:
             pygame.draw.rect(self.screen, RED, (10, 50, 100, 10))
             pygame.draw.rect(self.screen, GREEN, (10, 50, cooldown_width, 10))
         else:
-            dash_text = self.small_font.render("DASH READY", True, GREEN)
-            self.screen.blit(dash_text, (10, 50))
+            self.screen.blit(self.dash_ready_text, (10, 50))
         
         # Controls
-        controls_text = self.small_font.render("Arrow Keys=Move  Z=Jump  X=Dash", True, GRAY)
-        self.screen.blit(controls_text, (10, SCREEN_HEIGHT - 30))
+        self.screen.blit(self.controls_text, (10, SCREEN_HEIGHT - 30))
         
         # Game over screen
         if self.game_over:
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            overlay.set_alpha(200)
-            overlay.fill(BLACK)
-            self.screen.blit(overlay, (0, 0))
+            self.screen.blit(self.game_over_overlay, (0, 0))
             
-            game_over_text = self.font.render("GAME OVER", True, RED)
-            score_text = self.font.render(f"Final Score: {self.score}", True, WHITE)
-            restart_text = self.small_font.render("Press R to Restart", True, WHITE)
+            if self.score != self.final_score_text_value:
+                self.final_score_text = self.font.render(f"Final Score: {self.score}", True, WHITE)
+                self.final_score_text_value = self.score
+            score_text = self.final_score_text
             
-            self.screen.blit(game_over_text, 
-                           (SCREEN_WIDTH // 2 - game_over_text.get_width() // 2, 
+            self.screen.blit(self.game_over_text, 
+                           (SCREEN_WIDTH // 2 - self.game_over_text.get_width() // 2, 
                             SCREEN_HEIGHT // 2 - 50))
             self.screen.blit(score_text, 
                            (SCREEN_WIDTH // 2 - score_text.get_width() // 2, 
                             SCREEN_HEIGHT // 2))
-            self.screen.blit(restart_text, 
-                           (SCREEN_WIDTH // 2 - restart_text.get_width() // 2, 
+            self.screen.blit(self.restart_text, 
+                           (SCREEN_WIDTH // 2 - self.restart_text.get_width() // 2, 
                             SCREEN_HEIGHT // 2 + 50))
         
-        pygame.display.flip()
+        # The grid and platforms scroll with the camera, so any camera movement
+        # (or entering game over) changes the whole screen. Otherwise only the
+        # dynamic regions of this frame and the last one need presenting.
+        dirty_rects = self.get_dirty_rects(visible, camera_x, camera_y)
+        view = (camera_x, camera_y, self.game_over)
+        if view != self.last_view:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self.last_dirty_rects + dirty_rects)
+        self.last_view = view
+        self.last_dirty_rects = dirty_rects
+    
+    def get_dirty_rects(self, visible, camera_x, camera_y):
+        """Get screen regions that can change while the camera is still"""
+        dirty_rects = [
+            self.player.get_rect().move(-camera_x, -camera_y),
+            self.score_text.get_rect(topleft=(10, 10)),
+            self.dash_indicator_rect,
+        ]
+        for platform in visible:
+            if platform.platform_type == PlatformType.MOVING or platform.crumble_timer > 0:
+                dirty_rects.append(platform.rect.move(-camera_x, -camera_y))
+        return dirty_rects
+    
+    def get_platform_surface(self, color, width, height):
+        """Get cached solid surface for a platform body"""
+        key = (color, width, height)
+        surface = self.platform_surfaces.get(key)
+        if surface is None:
+            surface = pygame.Surface((width, height)).convert()
+            surface.fill(color)
+            self.platform_surfaces[key] = surface
+        return surface
     
     def run(self):
         """Main game loop"""